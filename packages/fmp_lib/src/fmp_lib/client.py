@@ -1,5 +1,6 @@
 # client.py
 
+from .settings import QUOTE_CACHE_TTL, QUOTE_CACHE_MAXSIZE
 from .stock_market import StockMarket
 
 class Client:
@@ -7,12 +8,23 @@ class Client:
     A client to interact with the Financial Modeling Prep (FMP) API.
 
     :param api_key: Your FMP API key.
+    :param quote_cache_ttl: Seconds a quote is served from memory before it is re-fetched.
+    :param quote_cache_maxsize: Maximum number of symbols kept in the quote cache.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        quote_cache_ttl: float = QUOTE_CACHE_TTL,
+        quote_cache_maxsize: int = QUOTE_CACHE_MAXSIZE,
+    ):
         if not api_key:
             raise ValueError("API key must be provided.")
         self.api_key = api_key
 
         # Initialize endpoint-specific classes
-        self.stock_market = StockMarket(api_key=self.api_key)
+        self.stock_market = StockMarket(
+            api_key=self.api_key,
+            quote_cache_ttl=quote_cache_ttl,
+            quote_cache_maxsize=quote_cache_maxsize,
+        )
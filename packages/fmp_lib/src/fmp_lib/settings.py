@@ -5,6 +5,8 @@ BASE_URL_v4: str = "https://financialmodelingprep.com/api/v4/"
 
 DEFAULT_LINE_PARAMETER = "line"
 DEFAULT_LIMIT: int = 10
+QUOTE_CACHE_TTL: int = 60  # seconds a quote is reused before re-querying FMP
+QUOTE_CACHE_MAXSIZE: int = 4096  # maximum number of symbols kept in the quote cache
 
 COMMODITY_VALUES: Dict[str, str] = {
     "ZTUSD": "2-Year T-Note Futures",   # Bonds
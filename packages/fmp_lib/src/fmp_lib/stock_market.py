@@ -1,21 +1,38 @@
 # stock_market.py
 
+import threading
+import time
 import typing
+from concurrent.futures import ThreadPoolExecutor
 
-from .settings import SECTOR_ETF_VALUES, COMMODITY_VALUES
+from .settings import SECTOR_ETF_VALUES, COMMODITY_VALUES, QUOTE_CACHE_TTL, QUOTE_CACHE_MAXSIZE
 from .url_methods import _return_json_v3, _return_json_v4
 
+MAX_QUOTE_WORKERS: int = 16
+
 class StockMarket:
     """
     Handles interactions with the Stock Market endpoints of the FMP API.
 
     :param api_key: Your FMP API key.
+    :param quote_cache_ttl: Seconds a quote is served from memory before it is re-fetched.
+    :param quote_cache_maxsize: Maximum number of symbols kept in the quote cache.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        quote_cache_ttl: float = QUOTE_CACHE_TTL,
+        quote_cache_maxsize: int = QUOTE_CACHE_MAXSIZE,
+    ):
         if not api_key:
             raise ValueError("API key must be provided to StockMarket.")
         self.api_key = api_key
+        self._query_vars = {"apikey": api_key}
+        self.quote_cache_ttl = quote_cache_ttl
+        self.quote_cache_maxsize = quote_cache_maxsize
+        self._quote_cache: typing.Dict[str, typing.Tuple[float, typing.List[typing.Dict]]] = {}
+        self._quote_cache_lock = threading.Lock()
 
 
     def gainers(self) -> typing.Optional[typing.List[typing.Dict]]:
@@ -25,8 +42,7 @@ class StockMarket:
         :return: A list of dictionaries containing gainers data.
         """
         path = "stock_market/gainers"
-        query_vars = {"apikey": self.api_key}
-        return _return_json_v3(path=path, query_vars=query_vars)
+        return _return_json_v3(path=path, query_vars=self._query_vars)
 
 
     def losers(self) -> typing.Optional[typing.List[typing.Dict]]:
@@ -36,37 +52,103 @@ class StockMarket:
         :return: A list of dictionaries containing losers data.
         """
         path = "stock_market/losers"
-        query_vars = {"apikey": self.api_key}
-        return _return_json_v3(path=path, query_vars=query_vars)
+        return _return_json_v3(path=path, query_vars=self._query_vars)
+
+
+    def movers(self) -> typing.Dict[str, typing.Optional[typing.List[typing.Dict]]]:
+        """
+        Retrieve the top gainers and losers from the stock market.
+
+        Both endpoints are queried concurrently, so the pair costs a single round trip.
+
+        :return: A dictionary with "gainers" and "losers" lists of dictionaries.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            gainers = executor.submit(self.gainers)
+            losers = executor.submit(self.losers)
+            return {"gainers": gainers.result(), "losers": losers.result()}
 
 
     def quote(self, symbol: str) -> typing.Optional[typing.List[typing.Dict]]:
         """
         Retrieve the quote for the desire asset.
 
+        Non-empty responses are cached in memory for `quote_cache_ttl` seconds, for up
+        to `quote_cache_maxsize` symbols. Cached results are shared between callers
+        and must not be mutated.
+
         :param apikey: Your API key
         :param symbol: The Ticker(s), Index(es), Commodity(ies), etc. symbol to query for.
         :return: A list of dictionaries containing quote data.
         """
+        cached = self._quote_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < self.quote_cache_ttl:
+            return cached[1]
+
         path = f"quote/{symbol}"
-        query_vars = {"apikey": self.api_key}
-        return _return_json_v3(path=path, query_vars=query_vars)
-    
+        quote_data = _return_json_v3(path=path, query_vars=self._query_vars)
+        if quote_data:
+            self._cache_quote(symbol, quote_data)
+        return quote_data
+
+
+    def _cache_quote(self, symbol: str, quote_data: typing.List[typing.Dict]) -> None:
+        """
+        Store a quote in the cache, keeping it within `quote_cache_maxsize` entries.
+
+        When the cache is full, expired entries are dropped first, then the oldest ones.
+
+        :param symbol: The symbol the quote was retrieved for.
+        :param quote_data: The quote data to cache.
+        """
+        now = time.monotonic()
+        with self._quote_cache_lock:
+            self._quote_cache.pop(symbol, None)
+            if len(self._quote_cache) >= self.quote_cache_maxsize:
+                expired = [
+                    key for key, (cached_at, _) in self._quote_cache.items()
+                    if now - cached_at >= self.quote_cache_ttl
+                ]
+                for key in expired:
+                    del self._quote_cache[key]
+            while self._quote_cache and len(self._quote_cache) >= self.quote_cache_maxsize:
+                del self._quote_cache[next(iter(self._quote_cache))]
+            if self.quote_cache_maxsize > 0:
+                self._quote_cache[symbol] = (now, quote_data)
+
+
+    def _quotes(
+        self, symbols: typing.List[str]
+    ) -> typing.List[typing.Optional[typing.List[typing.Dict]]]:
+        """
+        Retrieve quotes for several symbols concurrently.
+
+        Each symbol is an independent request, so they are issued from a thread pool
+        rather than one after another.
+
+        :param symbols: The symbols to query for.
+        :return: The quote data for each symbol, in the same order as `symbols`.
+        """
+        if not symbols:
+            return []
+        with ThreadPoolExecutor(max_workers=min(MAX_QUOTE_WORKERS, len(symbols))) as executor:
+            return list(executor.map(self.quote, symbols))
+
 
     def sectors_performance(self) -> typing.Optional[typing.List[typing.Dict]]:
         """
         Retrieve performance data for ETFs linked to market sectors.
 
         For each sector in SECTOR_ETF_VALUES, fetch the ETF's latest quote using
-        the `quote` method and compile its symbol, price, percentage change, name,
-        and sector into a dictionary.
+        the `quote` method (concurrently) and compile its symbol, price, percentage
+        change, name, and sector into a dictionary.
 
         :return: List of dictionaries containing sector performance data.
         """
         performance_data: typing.List[typing.Dict] = []
+        quotes = self._quotes(list(SECTOR_ETF_VALUES.values()))
 
-        for sector, symbol in SECTOR_ETF_VALUES.items():
-            quote_data = self.quote(symbol)
+        for (sector, symbol), quote_data in zip(SECTOR_ETF_VALUES.items(), quotes):
             if quote_data:
                 quote = quote_data[0]
                 performance_data.append({
@@ -84,15 +166,15 @@ class StockMarket:
         Retrieve performance data for commodities.
 
         For each commodity in COMMODITY_VALUES, fetch the latest quote using
-        the `quote` method and compile its name, symbol, price, and percentage change
-        into a dictionary.
+        the `quote` method (concurrently) and compile its name, symbol, price, and
+        percentage change into a dictionary.
 
         :return: List of dictionaries containing commodity performance data.
         """
         performance_data: typing.List[typing.Dict] = []
+        quotes = self._quotes(list(COMMODITY_VALUES.keys()))
 
-        for commodity_name, symbol in COMMODITY_VALUES.items():
-            quote_data = self.quote(symbol)
+        for (symbol, commodity_name), quote_data in zip(COMMODITY_VALUES.items(), quotes):
             if quote_data:
                 quote = quote_data[0]
                 performance_data.append({
@@ -1,9 +1,12 @@
 import csv
 import io
+import json
 import logging
 import typing
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .settings import (
     BASE_URL_v3,
@@ -13,105 +16,146 @@ from .settings import (
 CONNECT_TIMEOUT = 5
 READ_TIMEOUT = 30
 
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+# Retry failed connections and 429/5xx responses, but never a read timeout, so a
+# hung endpoint still fails after READ_TIMEOUT. Retry-After is ignored in favour of
+# the short backoff, as FMP may ask for waits far longer than a page render.
+MAX_RETRIES = Retry(
+    total=3,
+    read=False,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=False,
+)
+
+_LOG = logging.getLogger(__name__)
+
 # Disable excessive DEBUG messages.
 logging.getLogger("requests").setLevel(logging.WARNING)
 logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 
-def _return_json_v3(
-    path: str, query_vars: typing.Dict
-) -> typing.Optional[typing.List]:
+def _build_session() -> requests.Session:
     """
-    Query URL for JSON response for v3 of FMP API.
+    Build a session shared by all FMP requests so TCP/TLS connections are pooled
+    and reused across calls instead of being opened per request.
 
-    :param path: Path after TLD of URL
-    :param query_vars: Dictionary of query values (after "?" of URL)
-    :return: JSON response
+    Connection errors and 429/5xx responses are retried per MAX_RETRIES; read
+    timeouts are not.
+
+    :return: Session with a pooled, retrying HTTPS adapter mounted
     """
-    url = f"{BASE_URL_v3}{path}"
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=MAX_RETRIES,
+    )
+    session.mount("https://", adapter)
+    return session
 
-    return_var = None
-    try:
-        response = requests.get(
-            url, params=query_vars, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
-        )
-        if len(response.content) > 0:
-            return_var = response.json()
-
-        if len(response.content) == 0 or (
-            isinstance(return_var, dict) and len(return_var.keys()) == 0
-        ):
-            logging.warning("Response appears to have no data.  Returning empty List.")
-            return_var = []
-
-    except requests.Timeout:
-        logging.error(f"Connection to {url} timed out.")
-    except requests.ConnectionError:
-        logging.error(
-            f"Connection to {url} failed:  DNS failure, refused connection or some other connection related "
-            f"issue."
-        )
-    except requests.TooManyRedirects:
-        logging.error(
-            f"Request to {url} exceeds the maximum number of predefined redirections."
-        )
-    except Exception as e:
-        logging.error(
-            f"A requests exception has occurred that we have not yet detailed an 'except' clause for.  "
-            f"Error: {e}"
-        )
 
-    return return_var
+_SESSION = _build_session()
 
 
-def _return_json_v4(
-    path: str, query_vars: typing.Dict
-) -> typing.Optional[typing.List]:
+def _parse_json_or_csv(content: bytes) -> typing.List:
     """
-    Query URL for JSON response for v4 of FMP API.
+    Parse a response body as JSON, falling back to CSV rows for v4 endpoints.
 
-    :param path: Path after TLD of URL
-    :param query_vars: Dictionary of query values (after "?" of URL)
-    :return: JSON response
+    :param content: Raw response body
+    :return: Parsed JSON, or a list of row dictionaries if the body is CSV
     """
-    url = f"{BASE_URL_v4}{path}"
-    return_var = None
     try:
-        response = requests.get(
-            url, params=query_vars, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
-        )
-        if len(response.content) > 0:
-            try:
-                return response.json()
-            except Exception as e:
-                # check if response.content is csv, convert csv to json format
-                content = response.content.decode("utf-8")
-                try:
-                    reader = csv.DictReader(io.StringIO(content))
-                    return [row for row in reader]
-                except csv.Error:
-                    raise e
-
-        if len(response.content) == 0 or (
-            isinstance(return_var, dict) and len(return_var.keys()) == 0
-        ):
-            logging.warning("Response appears to have no data.  Returning empty List.")
-            return_var = []
-
-    except requests.Timeout:
-        logging.error(f"Connection to {url} timed out.")
-    except requests.ConnectionError:
-        logging.error(
-            f"Connection to {url} failed:  DNS failure, refused connection or some other connection related "
-            f"issue."
-        )
-    except requests.TooManyRedirects:
-        logging.error(
-            f"Request to {url} exceeds the maximum number of predefined redirections."
-        )
+        return json.loads(content)
     except Exception as e:
-        logging.error(
-            f"A requests exception has occurred that we have not yet detailed an 'except' clause for.  "
-            f"Error: {e}"
-        )
-    return return_var
+        # check if content is csv, convert csv to json format
+        try:
+            return list(csv.DictReader(io.StringIO(content.decode("utf-8"))))
+        except csv.Error:
+            raise e
+
+
+class _JsonFetcher(typing.Protocol):
+    """
+    Signature of the functions built by `_make_fetcher`.
+    """
+
+    def __call__(
+        self, path: str, query_vars: typing.Dict
+    ) -> typing.Optional[typing.List]: ...
+
+
+def _make_fetcher(
+    base_url: str, session: requests.Session, csv_fallback: bool = False
+) -> _JsonFetcher:
+    """
+    Build a function querying a version of the FMP API for a JSON response.
+
+    The base URL, `session.get` and timeouts are bound once here rather than
+    looked up on every request.
+
+    :param base_url: URL prefix the request path is appended to
+    :param session: Session used to issue the requests
+    :param csv_fallback: Return non-JSON bodies as parsed CSV rows
+    :return: Function taking a path and query values and returning the JSON response
+    """
+    get = session.get
+    timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+
+    def _return_json(
+        path: str, query_vars: typing.Dict
+    ) -> typing.Optional[typing.List]:
+        """
+        Query URL for JSON response.
+
+        :param path: Path after TLD of URL
+        :param query_vars: Dictionary of query values (after "?" of URL)
+        :return: JSON response
+        """
+        url = base_url + path
+
+        return_var = None
+        try:
+            response = get(url, params=query_vars, timeout=timeout)
+            content = response.content
+            if content:
+                if csv_fallback:
+                    return _parse_json_or_csv(content)
+                return_var = json.loads(content)
+
+            if not content or (isinstance(return_var, dict) and not return_var):
+                _LOG.warning("Response appears to have no data.  Returning empty List.")
+                return_var = []
+
+        except requests.Timeout:
+            _LOG.error("Connection to %s timed out.", url)
+        except requests.ConnectionError:
+            _LOG.error(
+                "Connection to %s failed:  DNS failure, refused connection or some other connection related "
+                "issue.",
+                url,
+            )
+        except requests.TooManyRedirects:
+            _LOG.error(
+                "Request to %s exceeds the maximum number of predefined redirections.", url
+            )
+        except requests.RequestException as e:
+            _LOG.error(
+                "A requests exception has occurred that we have not yet detailed an 'except' clause for.  "
+                "Error: %s",
+                e,
+            )
+        except ValueError as e:
+            _LOG.error("Response from %s could not be decoded.  Error: %s", url, e)
+
+        return return_var
+
+    return _return_json
+
+
+# Query URL for JSON response for v3 of FMP API.
+_return_json_v3 = _make_fetcher(BASE_URL_v3, _SESSION)
+
+# Query URL for JSON response for v4 of FMP API (CSV bodies are returned as rows).
+_return_json_v4 = _make_fetcher(BASE_URL_v4, _SESSION, csv_fallback=True)
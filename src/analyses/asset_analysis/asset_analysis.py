@@ -4,61 +4,25 @@ import streamlit as st
 import streamlit.components.v1 as components
 import src.analyses.asset_analysis.utils as ut
 
-def render_tradingview_widget(symbol: str, placeholder):
+def render_tradingview_widget(symbol: str):
     """
-    Renders the TradingView widget for the given symbol into the provided placeholder.
+    Renders the TradingView widget for the given symbol.
     """
-    valid_symbol = ut.map_commodity_symbol(symbol)
-    tradingview_html = f"""
-    <!-- TradingView Widget BEGIN -->
-    <div style="height:900px;width:100%;overflow:hidden;">
-      <div class="tradingview-widget-container" style="height:100%;width:100%;">
-        <div class="tradingview-widget-container__widget" style="height:calc(100% - 32px);width:100%;"></div>
-        <script type="text/javascript" src="https://s3.tradingview.com/external-embedding/embed-widget-advanced-chart.js" async>
-        {{
-          "symbol": "{valid_symbol}",
-          "timezone": "Europe/Vienna",
-          "theme": "light",
-          "style": "1",
-          "locale": "en",
-          "hide_legend": false,
-          "withdateranges": true,
-          "range": "60M",
-          "allow_symbol_change": false,
-          "save_image": false,
-          "calendar": false,
-          "studies": ["STD;RSI"]
-        }}
-        </script>
-      </div>
-    </div>
-    <!-- TradingView Widget END -->
-    """
-    placeholder.empty()
-    with placeholder:
-        components.html(tradingview_html, height=1000, scrolling=False)
-
-def search_callback():
-    """
-    Callback invoked when the search text input changes.
-    Renders the TradingView widget using the search query.
-    """
-    symbol = st.session_state.asset_analysis_search_symbol
-    if symbol:
-        render_tradingview_widget(symbol, chart_placeholder)
-
+    tradingview_html = ut.build_tradingview_html(symbol)
+    components.html(tradingview_html, height=1000, scrolling=False)
 
 def get_symbol_to_show():
     """
     Returns the symbol to show.
     Priority is given to the search symbol over the asset_symbol stored in session state.
     """
-    search_symbol = st.session_state.get("asset_analysis_search_symbol", "").strip()
+    session_state = st.session_state
+    search_symbol = session_state.get("asset_analysis_search_symbol", "").strip()
     if search_symbol:
         return search_symbol
     
     # If no search symbol is provided, default to asset_symbol.
-    return st.session_state.get("asset_symbol")
+    return session_state.get("asset_symbol")
 
 # Create two columns for header: one for the title and one for the search box.
 title_col, search_col = st.columns([3, 1])
@@ -77,17 +41,14 @@ with search_col:
         "Search",
         placeholder="Enter asset symbol 🔍",
         label_visibility="hidden",
-        key="asset_analysis_search_symbol",
-        on_change=search_callback
+        key="asset_analysis_search_symbol"
     )
 
 st.divider()
 
-# Create the placeholder to display the chart below the title and divider.
-chart_placeholder = st.empty()
-
-# Render the chart if a symbol is available.
+# Render the chart below the title and divider if a symbol is available.
+# Editing the search box reruns the page, which picks up the new symbol here.
 if symbol_to_show:
-    render_tradingview_widget(symbol_to_show, chart_placeholder)
+    render_tradingview_widget(symbol_to_show)
 else:
     st.warning("No asset selected. Please select an asset, or search for a symbol.")
@@ -1,5 +1,24 @@
 # analyses/utils.py
 
+# Commodity symbols whose FMP format is invalid for TradingView, mapped to valid ones.
+COMMODITY_SYMBOL_MAPPING = {
+    "ZTUSD": "CBOT:ZT1!",    # 2-Year T-Note Futures
+    "ZNUSD": "CBOT:ZN1!",    # 10-Year T-Note Futures
+    "ALIUSD": "COMEX:ALI1!", # Aluminum Futures
+    "HGUSD": "COMEX:HG1!",   # Copper Futures
+    "GCUSD": "COMEX:GC1!",   # Gold Futures
+    "SIUSD": "COMEX:SI1!",   # Silver Futures
+    "RBUSD": "NYMEX:RB1!",   # Gasoline RBOB Futures
+    "CLUSD": "NYMEX:CL1!",   # Crude Oil Futures
+    "NGUSD": "NYMEX:NG1!",   # Natural Gas Futures
+    "BZUSD": "NYMEX:BB1!",   # Brent Crude Oil Futures
+    "KEUSX": "CBOT:KE1!",    # Wheat Futures
+    "ZCUSX": "CBOT:ZC1!",    # Corn Futures
+    "LBUSD": "CME:LBR1!",    # Lumber Futures
+    "ZOUSX": "CBOT:ZO1!",    # Oat Futures
+    "KCUSX": "NYMEX:KT1!",   # Coffee Futures
+}
+
 def map_commodity_symbol(incoming_symbol: str) -> str:
     """
     Maps an incoming commodity asset symbol to a valid symbol for TradingView.
@@ -10,22 +29,42 @@ def map_commodity_symbol(incoming_symbol: str) -> str:
     :param incoming_symbol: The asset symbol as received.
     :return: A valid asset symbol for TradingView.
     """
-    COMMODITY_SYMBOL_MAPPING = {
-        "ZTUSD": "CBOT:ZT1!",    # 2-Year T-Note Futures
-        "ZNUSD": "CBOT:ZN1!",    # 10-Year T-Note Futures
-        "ALIUSD": "COMEX:ALI1!", # Aluminum Futures
-        "HGUSD": "COMEX:HG1!",   # Copper Futures
-        "GCUSD": "COMEX:GC1!",   # Gold Futures
-        "SIUSD": "COMEX:SI1!",   # Silver Futures
-        "RBUSD": "NYMEX:RB1!",   # Gasoline RBOB Futures
-        "CLUSD": "NYMEX:CL1!",   # Crude Oil Futures
-        "NGUSD": "NYMEX:NG1!",   # Natural Gas Futures
-        "BZUSD": "NYMEX:BB1!",   # Brent Crude Oil Futures
-        "KEUSX": "CBOT:KE1!",    # Wheat Futures
-        "ZCUSX": "CBOT:ZC1!",    # Corn Futures
-        "LBUSD": "CME:LBR1!",    # Lumber Futures
-        "ZOUSX": "CBOT:ZO1!",    # Oat Futures
-        "KCUSX": "NYMEX:KT1!",   # Coffee Futures
-    }
-    
     return COMMODITY_SYMBOL_MAPPING.get(incoming_symbol, incoming_symbol)
+
+
+# TradingView advanced chart widget, split once around the symbol placeholder.
+TRADINGVIEW_HTML_TEMPLATE = """
+    <!-- TradingView Widget BEGIN -->
+    <div style="height:900px;width:100%;overflow:hidden;">
+      <div class="tradingview-widget-container" style="height:100%;width:100%;">
+        <div class="tradingview-widget-container__widget" style="height:calc(100% - 32px);width:100%;"></div>
+        <script type="text/javascript" src="https://s3.tradingview.com/external-embedding/embed-widget-advanced-chart.js" async>
+        {
+          "symbol": "{symbol}",
+          "timezone": "Europe/Vienna",
+          "theme": "light",
+          "style": "1",
+          "locale": "en",
+          "hide_legend": false,
+          "withdateranges": true,
+          "range": "60M",
+          "allow_symbol_change": false,
+          "save_image": false,
+          "calendar": false,
+          "studies": ["STD;RSI"]
+        }
+        </script>
+      </div>
+    </div>
+    <!-- TradingView Widget END -->
+"""
+_TRADINGVIEW_HTML_PREFIX, _TRADINGVIEW_HTML_SUFFIX = TRADINGVIEW_HTML_TEMPLATE.split("{symbol}")
+
+def build_tradingview_html(symbol: str) -> str:
+    """
+    Builds the TradingView widget HTML for the given asset symbol.
+    
+    :param symbol: The asset symbol as received.
+    :return: The widget HTML, using the TradingView-compatible symbol.
+    """
+    return _TRADINGVIEW_HTML_PREFIX + map_commodity_symbol(symbol) + _TRADINGVIEW_HTML_SUFFIX
@@ -4,13 +4,30 @@
 Data Fetching Module for FMP Library.
 
 Provides functions to retrieve data using the FMP API client.
-Each function is cached to optimize performance.
+Each request is cached for CACHE_TTL seconds to optimize performance;
+daily gainers and losers share a single cached fetch.
 """
 
 import streamlit as st
 
+# Seconds fetched market data is reused across reruns before it is re-requested.
+CACHE_TTL = 60
+
+
+@st.cache_data(ttl=CACHE_TTL)
+def fetch_market_movers(_fmp_client):
+    """
+    Retrieve today's top gaining and losing stocks in one concurrent request pair.
+
+    Args:
+        _fmp_client (FMPClient): Initialized FMP API client.
+
+    Returns:
+        dict: Data of daily gainers and losers under "gainers" and "losers".
+    """
+    return _fmp_client.stock_market.movers()
+
 
-@st.cache_data
 def fetch_daily_gainers(_fmp_client):
     """
     Retrieve today's top gaining stocks.
@@ -21,10 +38,9 @@ def fetch_daily_gainers(_fmp_client):
     Returns:
         list of dict: Data of daily gainers.
     """
-    return _fmp_client.stock_market.gainers()
+    return fetch_market_movers(_fmp_client)["gainers"]
 
 
-@st.cache_data
 def fetch_daily_losers(_fmp_client):
     """
     Retrieve today's top losing stocks.
@@ -35,10 +51,10 @@ def fetch_daily_losers(_fmp_client):
     Returns:
         list of dict: Data of daily losers.
     """
-    return _fmp_client.stock_market.losers()
+    return fetch_market_movers(_fmp_client)["losers"]
 
 
-@st.cache_data
+@st.cache_data(ttl=CACHE_TTL)
 def fetch_sector_performance(_fmp_client):
     """
     Get performance data for market sectors.
@@ -52,7 +68,7 @@ def fetch_sector_performance(_fmp_client):
     return _fmp_client.stock_market.sectors_performance()
 
 
-@st.cache_data
+@st.cache_data(ttl=CACHE_TTL)
 def fetch_commodities_performance(_fmp_client):
     """
     Get performance data for commodities.
@@ -31,9 +31,11 @@ def _retrieve_fmp():
 def _ensure_numeric_changes_percentage(df: pd.DataFrame) -> pd.DataFrame:
     """
     Ensures that 'changesPercentage' is a numeric column by converting values as needed.
+    Columns that are already numeric are left untouched.
     """
-    if 'changesPercentage' in df.columns:
-        df['changesPercentage'] = pd.to_numeric(df['changesPercentage'], errors='coerce')
+    col = df.get('changesPercentage')
+    if col is not None and not pd.api.types.is_numeric_dtype(col):
+        df['changesPercentage'] = pd.to_numeric(col, errors='coerce')
     return df
 
 def _get_sort_order(config, default_col: str = "changesPercentage", default_order: str = "desc") -> str:
@@ -44,31 +46,45 @@ def _get_sort_order(config, default_col: str = "changesPercentage", default_orde
     sort_config = config.default_sort or [{ "colId": default_col, "sort": default_order }]
     return sort_config[0].get("sort", default_order)
 
-def _build_grid_options(df: pd.DataFrame, config) -> dict:
+def _to_plain_dict(value):
     """
-    Build grid options from a DataFrame and TableModel configuration.
+    Recursively converts the nested defaultdicts built by GridOptionsBuilder into plain
+    dicts, so grid options can be pickled by st.cache_data.
+    """
+    if isinstance(value, dict):
+        return {key: _to_plain_dict(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_to_plain_dict(item) for item in value]
+    return value
+
+@st.cache_data(show_spinner=False)
+def _cached_grid_options(schema: tuple, config_key: str, _df: pd.DataFrame, _config) -> dict:
+    """
+    Build grid options for a column schema and table, cached across reruns.
     
-    :param df: The data as a DataFrame.
-    :param config: A TableModel instance.
+    :param schema: The (column, dtype) pairs of the data, used as the cache key.
+    :param config_key: The table configuration's display fields as JSON, used as the cache key.
+    :param _df: An empty DataFrame with the data's columns and dtypes.
+    :param _config: A TableModel instance.
     :return: Grid options as a dict.
     """
-    gb = GridOptionsBuilder.from_dataframe(df)
+    gb = GridOptionsBuilder.from_dataframe(_df)
     gb.configure_pagination(paginationAutoPageSize=True)
     gb.configure_selection('single')
 
     # Set column names based on the columns_mapping from the configuration
-    for col_key, header in config.columns_mapping.items():
+    for col_key, header in _config.columns_mapping.items():
         gb.configure_column(col_key, headerName=header)
     
     # Hide columns as specified in the configuration
-    for col_to_hide in config.columns_to_hide:
+    for col_to_hide in _config.columns_to_hide:
         gb.configure_column(col_to_hide, hide=True)
 
     # Ensure all columns are sortable by default
     gb.configure_default_column(sortable=True)
 
-    sort_order = _get_sort_order(config)
-    cp_column_header = config.columns_mapping.get("changesPercentage", "changesPercentage")
+    sort_order = _get_sort_order(_config)
+    cp_column_header = _config.columns_mapping.get("changesPercentage", "changesPercentage")
 
     gb.configure_column(
         "changesPercentage",
@@ -77,7 +93,23 @@ def _build_grid_options(df: pd.DataFrame, config) -> dict:
         sort=sort_order
     )
 
-    return gb.build()
+    return _to_plain_dict(gb.build())
+
+def _build_grid_options(df: pd.DataFrame, config) -> dict:
+    """
+    Build grid options from a DataFrame and TableModel configuration.
+
+    The options only depend on the DataFrame's columns and dtypes and on the table
+    configuration, so they are built once per schema and configuration and reused
+    across reruns.
+    
+    :param df: The data as a DataFrame.
+    :param config: A TableModel instance.
+    :return: Grid options as a dict.
+    """
+    schema = tuple((col, str(dtype)) for col, dtype in df.dtypes.items())
+    config_key = config.model_dump_json(exclude={"fetch_func"})
+    return _cached_grid_options(schema, config_key, df.head(0), config)
 
 def _navigate_to_analysis(selected_data: dict) -> None:
     """
@@ -117,7 +149,8 @@ def render_table(col, config) -> None:
                 height=600,
                 fit_columns_on_grid_load=True,
                 allow_unsafe_jscode=True,
-                update_mode=GridUpdateMode.SELECTION_CHANGED
+                update_mode=GridUpdateMode.SELECTION_CHANGED,
+                key=f"overview-grid-{config.title}"
             )
 
             selected_rows = grid_response.get("selected_rows")
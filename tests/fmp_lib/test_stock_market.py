@@ -0,0 +1,126 @@
+# fmp_lib/test_stock_market.py
+
+import pytest
+
+from fmp_lib import stock_market
+from fmp_lib.client import Client
+from fmp_lib.stock_market import StockMarket
+
+
+class _FakeClock:
+    """
+    Stand-in for time.monotonic that only advances when told to.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Replace the clock used by the quote cache with a controllable one.
+    """
+    fake_clock = _FakeClock()
+    monkeypatch.setattr(stock_market.time, "monotonic", fake_clock)
+    return fake_clock
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    """
+    Replace the FMP v3 request with a fake fetcher, returning the list of requested paths.
+    """
+    paths = []
+
+    def fake_return_json_v3(path, query_vars):
+        paths.append(path)
+        return [{"symbol": path.rsplit("/", 1)[-1]}]
+
+    monkeypatch.setattr(stock_market, "_return_json_v3", fake_return_json_v3)
+    return paths
+
+
+def test_quote_served_from_cache_within_ttl(clock, fetched):
+    market = StockMarket("key", quote_cache_ttl=60)
+
+    market.quote("AAA")
+    clock.now = 59
+    market.quote("AAA")
+
+    assert fetched == ["quote/AAA"]
+
+
+def test_quote_refetched_after_ttl(clock, fetched):
+    market = StockMarket("key", quote_cache_ttl=60)
+
+    market.quote("AAA")
+    clock.now = 60
+    market.quote("AAA")
+
+    assert fetched == ["quote/AAA", "quote/AAA"]
+
+
+def test_empty_quote_not_cached(clock, monkeypatch):
+    monkeypatch.setattr(stock_market, "_return_json_v3", lambda path, query_vars: [])
+    market = StockMarket("key")
+
+    market.quote("AAA")
+
+    assert market._quote_cache == {}
+
+
+def test_full_cache_drops_expired_entries_first(clock, fetched):
+    market = StockMarket("key", quote_cache_ttl=60, quote_cache_maxsize=3)
+
+    for now, symbol in [(0, "AAA"), (1, "BBB"), (2, "CCC")]:
+        clock.now = now
+        market.quote(symbol)
+    clock.now = 61.5
+    market.quote("DDD")
+
+    # AAA and BBB have expired; CCC is still fresh and is kept.
+    assert list(market._quote_cache) == ["CCC", "DDD"]
+
+
+def test_full_cache_drops_oldest_entries_when_none_expired(clock, fetched):
+    market = StockMarket("key", quote_cache_ttl=60, quote_cache_maxsize=3)
+
+    for now, symbol in enumerate(["AAA", "BBB", "CCC", "DDD"]):
+        clock.now = now
+        market.quote(symbol)
+
+    assert list(market._quote_cache) == ["BBB", "CCC", "DDD"]
+
+
+def test_refetched_quote_becomes_newest_entry(clock, fetched):
+    market = StockMarket("key", quote_cache_ttl=60, quote_cache_maxsize=3)
+
+    for now, symbol in enumerate(["AAA", "BBB", "CCC"]):
+        clock.now = now
+        market.quote(symbol)
+    clock.now = 60
+    market.quote("AAA")
+    market.quote("DDD")
+
+    assert list(market._quote_cache) == ["CCC", "AAA", "DDD"]
+
+
+def test_zero_maxsize_disables_cache(clock, fetched):
+    market = StockMarket("key", quote_cache_maxsize=0)
+
+    market.quote("AAA")
+    market.quote("AAA")
+
+    assert fetched == ["quote/AAA", "quote/AAA"]
+    assert market._quote_cache == {}
+
+
+def test_client_passes_cache_settings_to_stock_market():
+    client = Client("key", quote_cache_ttl=5, quote_cache_maxsize=10)
+
+    assert client.stock_market.quote_cache_ttl == 5
+    assert client.stock_market.quote_cache_maxsize == 10